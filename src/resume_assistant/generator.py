@@ -4,11 +4,76 @@ Resume Generator Module
 Generates plain text resumes from JSON Resume data for easy copy-paste.
 """
 
+import calendar
+import functools
+import io
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from .models import JSONResume
+from .models import JSONResume, Location
+
+_MONTHS = (
+    None, "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+# Values that mean "still ongoing", matched without lowercasing
+_PRESENT_DATES = frozenset({None, "", "present", "Present", "PRESENT"})
+
+# Banner lines for the text layout (80 columns, newline included)
+_BANNER_EQ = "=" * 80 + "\n"
+_BANNER_DASH = "-" * 80 + "\n"
+
+# Section headers: dashed banner, title, dashed banner, blank line
+_SECTION_HEADERS = {
+    title: f"{_BANNER_DASH}{title}\n{_BANNER_DASH}\n"
+    for title in (
+        "PROFESSIONAL SUMMARY",
+        "WORK EXPERIENCE",
+        "EDUCATION",
+        "SKILLS",
+        "PROJECTS",
+        "CERTIFICATIONS",
+        "LANGUAGES",
+        "INTERESTS",
+    )
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_date(date_str: Optional[str]) -> str:
+    """Format a date string for display (cached; the same dates recur often)."""
+    if date_str in _PRESENT_DATES:
+        return "Present"
+    
+    # Fast path for the plain YYYY-MM-DD form used by JSON Resume. Anything
+    # fromisoformat would reject (or strftime would print differently, such
+    # as years before 1000) falls through to the general path below.
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+        if all(part.isascii() and part.isdecimal() for part in (year, month, day)):
+            y, m, d = int(year), int(month), int(day)
+            if y >= 1000 and 1 <= m <= 12 and 1 <= d <= calendar.monthrange(y, m)[1]:
+                return f"{_MONTHS[m]} {year}"
+    
+    if date_str.lower() == "present":
+        return "Present"
+    
+    try:
+        # Try to parse ISO format
+        date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        return date.strftime("%B %Y")
+    except ValueError:
+        # Return as-is if can't parse
+        return date_str
+
+
+def _loc_str(loc: Optional[Location]) -> str:
+    """Format a location as "City, Region" (empty if neither is set)."""
+    if loc is None:
+        return ""
+    return ", ".join(filter(None, [loc.city, loc.region]))
 
 
 class ResumeGenerator:
@@ -31,22 +96,7 @@ class ResumeGenerator:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    @staticmethod
-    def _format_date(date_str: Optional[str]) -> str:
-        """Format a date string for display."""
-        if not date_str:
-            return "Present"
-        
-        if date_str.lower() == "present":
-            return "Present"
-        
-        try:
-            # Try to parse ISO format
-            date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            return date.strftime("%B %Y")
-        except ValueError:
-            # Return as-is if can't parse
-            return date_str
+    _format_date = staticmethod(_format_date)
 
     def generate_text(
         self,
@@ -63,70 +113,52 @@ class ResumeGenerator:
         Returns:
             Absolute path to generated text file
         """
-        lines = []
+        buf = io.StringIO()
+        w = buf.write
+        basics = resume.basics
         
         # Header
-        lines.append("=" * 80)
-        lines.append(resume.basics.name.upper().center(80))
-        lines.append("=" * 80)
-        lines.append("")
+        w(_BANNER_EQ)
+        w(f"{basics.name.upper():^80}\n")
+        w(_BANNER_EQ)
+        w("\n")
         
         # Contact info
-        contact_parts = []
-        if resume.basics.email:
-            contact_parts.append(resume.basics.email)
-        if resume.basics.phone:
-            contact_parts.append(resume.basics.phone)
-        if resume.basics.location:
-            loc = resume.basics.location
-            loc_str = ", ".join(filter(None, [loc.city, loc.region]))
-            if loc_str:
-                contact_parts.append(loc_str)
-        if resume.basics.url:
-            contact_parts.append(resume.basics.url)
+        contact = " | ".join([
+            p for p in (basics.email, basics.phone, _loc_str(basics.location), basics.url) if p
+        ])
         
-        if contact_parts:
-            lines.append(" | ".join(contact_parts))
-            lines.append("")
+        if contact:
+            w(f"{contact}\n\n")
 
         # Professional Summary
-        if resume.basics.summary:
-            lines.append("-" * 80)
-            lines.append("PROFESSIONAL SUMMARY")
-            lines.append("-" * 80)
-            lines.append("")
+        if basics.summary:
+            w(_SECTION_HEADERS["PROFESSIONAL SUMMARY"])
             # Wrap summary text nicely
-            lines.append(resume.basics.summary)
-            lines.append("")
+            w(f"{basics.summary}\n")
+            w("\n")
 
         # Work Experience
         if resume.work:
-            lines.append("-" * 80)
-            lines.append("WORK EXPERIENCE")
-            lines.append("-" * 80)
-            lines.append("")
+            w(_SECTION_HEADERS["WORK EXPERIENCE"])
             
             for work in resume.work:
                 # Position title
-                lines.append(work.position.upper())
+                w(f"{work.position.upper()}\n")
                 
                 # Company and date range
                 date_range = f"{self._format_date(work.startDate)} - {self._format_date(work.endDate)}"
-                lines.append(f"{work.name} | {date_range}")
+                w(f"{work.name} | {date_range}\n")
                 
                 # Highlights as bullet points
                 if work.highlights:
-                    for highlight in work.highlights:
-                        lines.append(f"  • {highlight}")
+                    w("".join([f"  • {highlight}\n" for highlight in work.highlights]))
                 
-                lines.append("")
+                w("\n")
 
         # Education
         if resume.education:
-            lines.append("-" * 80)
-            lines.append("EDUCATION")
-            lines.append("-" * 80)
-            lines.append("")
+            w(_SECTION_HEADERS["EDUCATION"])
             
             for edu in resume.education:
                 # Degree
@@ -137,7 +169,7 @@ class ResumeGenerator:
                     degree_parts.append(f"in {edu.area}")
                 
                 if degree_parts:
-                    lines.append(" ".join(degree_parts).upper())
+                    w(" ".join(degree_parts).upper() + "\n")
                 
                 # Institution and date
                 date_str = ""
@@ -146,62 +178,54 @@ class ResumeGenerator:
                 elif edu.startDate:
                     date_str = f" | {self._format_date(edu.startDate)} - Present"
                 
-                lines.append(f"{edu.institution}{date_str}")
+                w(f"{edu.institution}{date_str}\n")
                 
                 # GPA/Score
                 if edu.score:
-                    lines.append(f"  GPA: {edu.score}")
+                    w(f"  GPA: {edu.score}\n")
                 
                 # Relevant courses
                 if edu.courses:
-                    lines.append(f"  Relevant Coursework: {', '.join(edu.courses)}")
+                    w(f"  Relevant Coursework: {', '.join(edu.courses)}\n")
                 
-                lines.append("")
+                w("\n")
 
         # Skills
         if resume.skills:
-            lines.append("-" * 80)
-            lines.append("SKILLS")
-            lines.append("-" * 80)
-            lines.append("")
+            w(_SECTION_HEADERS["SKILLS"])
             
-            for skill in resume.skills:
-                if skill.keywords:
-                    lines.append(f"{skill.name}: {', '.join(skill.keywords)}")
+            w("".join([
+                f"{skill.name}: {', '.join(skill.keywords)}\n"
+                for skill in resume.skills
+                if skill.keywords
+            ]))
             
-            lines.append("")
+            w("\n")
 
         # Projects
         if resume.projects:
-            lines.append("-" * 80)
-            lines.append("PROJECTS")
-            lines.append("-" * 80)
-            lines.append("")
+            w(_SECTION_HEADERS["PROJECTS"])
             
             for project in resume.projects:
-                lines.append(project.name.upper())
+                w(f"{project.name.upper()}\n")
                 
                 if project.description:
-                    lines.append(f"  {project.description}")
+                    w(f"  {project.description}\n")
                 
                 if project.keywords:
-                    lines.append(f"  Technologies: {', '.join(project.keywords)}")
+                    w(f"  Technologies: {', '.join(project.keywords)}\n")
                 
                 if project.highlights:
-                    for highlight in project.highlights:
-                        lines.append(f"  • {highlight}")
+                    w("".join([f"  • {highlight}\n" for highlight in project.highlights]))
                 
                 if project.url:
-                    lines.append(f"  Link: {project.url}")
+                    w(f"  Link: {project.url}\n")
                 
-                lines.append("")
+                w("\n")
 
         # Certifications
         if resume.certificates:
-            lines.append("-" * 80)
-            lines.append("CERTIFICATIONS")
-            lines.append("-" * 80)
-            lines.append("")
+            w(_SECTION_HEADERS["CERTIFICATIONS"])
             
             for cert in resume.certificates:
                 cert_line = f"  • {cert.name}"
@@ -209,16 +233,13 @@ class ResumeGenerator:
                     cert_line += f" - {cert.issuer}"
                 if cert.date:
                     cert_line += f" ({self._format_date(cert.date)})"
-                lines.append(cert_line)
+                w(f"{cert_line}\n")
             
-            lines.append("")
+            w("\n")
 
         # Languages
         if resume.languages:
-            lines.append("-" * 80)
-            lines.append("LANGUAGES")
-            lines.append("-" * 80)
-            lines.append("")
+            w(_SECTION_HEADERS["LANGUAGES"])
             
             lang_parts = []
             for lang in resume.languages:
@@ -227,32 +248,28 @@ class ResumeGenerator:
                 else:
                     lang_parts.append(lang.language)
             
-            lines.append(", ".join(lang_parts))
-            lines.append("")
+            w(", ".join(lang_parts) + "\n")
+            w("\n")
 
         # Interests
         if resume.interests:
-            lines.append("-" * 80)
-            lines.append("INTERESTS")
-            lines.append("-" * 80)
-            lines.append("")
+            w(_SECTION_HEADERS["INTERESTS"])
             
             for interest in resume.interests:
                 if interest.keywords:
-                    lines.append(f"{interest.name}: {', '.join(interest.keywords)}")
+                    w(f"{interest.name}: {', '.join(interest.keywords)}\n")
                 else:
-                    lines.append(interest.name)
+                    w(f"{interest.name}\n")
             
-            lines.append("")
+            w("\n")
 
-        # Join all lines
-        content = "\n".join(lines)
+        # Every line writes its own newline; drop the one after the closing
+        # blank line so the file ends exactly as the old "\n".join did
+        content = buf.getvalue()[:-1]
 
         # Determine output path
         if filename is None:
-            safe_name = resume.basics.name.replace(" ", "_").lower()
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{safe_name}_resume_{timestamp}"
+            filename = resume.default_filename_stem("resume")
 
         output_path = self.output_dir / f"{filename}.txt"
 
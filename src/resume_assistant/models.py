@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -188,10 +188,19 @@ class ResumeExtensions(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid4()))
     industry: Optional[str] = None  # User's target industry (passed to LLM)
     target_roles: list[str] = Field(default_factory=list)  # Target job titles
-    created_at: str = Field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = Field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = ""  # Stamped by _stamp_timestamps when absent
+    updated_at: str = ""
     ats_score_history: list[ATSScoreRecord] = Field(default_factory=list)
 
+    @model_validator(mode="before")
+    @classmethod
+    def _stamp_timestamps(cls, data):
+        """Fill missing timestamps from a single clock read so they match."""
+        if isinstance(data, dict) and ("created_at" not in data or "updated_at" not in data):
+            now = datetime.now().isoformat()
+            data = {"created_at": now, "updated_at": now, **data}
+        return data
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Complete JSON Resume with Extensions
@@ -229,6 +238,10 @@ class JSONResume(BaseModel):
         data = self.model_dump(exclude={"extensions"})
         return data
 
+    def to_standard_json_bytes(self) -> bytes:
+        """Export as standard JSON Resume, serialized to UTF-8 JSON bytes by pydantic-core."""
+        return self.__pydantic_serializer__.to_json(self, exclude={"extensions"})
+
     def get_id(self) -> str:
         """Get the internal resume ID."""
         return self.extensions.id
@@ -242,6 +255,12 @@ class JSONResume(BaseModel):
         self.extensions.industry = industry
         self.extensions.updated_at = datetime.now().isoformat()
 
+    def default_filename_stem(self, suffix: str) -> str:
+        """Get a default output filename (without extension), e.g. jane_doe_resume_<timestamp>."""
+        safe_name = self.basics.name.replace(" ", "_").lower()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"{safe_name}_{suffix}_{timestamp}"
+
     def get_full_text(self) -> str:
         """Get all resume text for NLP analysis."""
         parts = []
@@ -279,4 +298,4 @@ class JSONResume(BaseModel):
         for cert in self.certificates:
             parts.append(f"{cert.name} from {cert.issuer or 'Unknown'}")
 
-        return " ".join(filter(None, parts))
+        return " ".join([p for p in parts if p])